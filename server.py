@@ -5,14 +5,264 @@ This server exposes methods to query the Oura API for sleep, readiness, and resi
 Users provide their Oura API token dynamically through Letta's interface.
 """
 
+import asyncio
+import hashlib
 import os
+import re
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
 from datetime import date, datetime
-from typing import Any, Optional
+from functools import lru_cache, wraps
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    Optional,
+    ParamSpec,
+)
 
 import httpx
+import orjson
 from fastmcp import FastMCP
-from fastmcp.client.transports import StreamableHttpTransport
-from fastmcp.client import Client
+
+P = ParamSpec("P")
+
+# Sleep record fields returned by get_sleep_data, in output order
+SLEEP_DURATION_FIELDS: tuple[str, ...] = (
+    "awake_time",
+    "deep_sleep_duration",
+    "light_sleep_duration",
+    "rem_sleep_duration",
+    "total_sleep_duration",
+    "time_in_bed",
+)
+SLEEP_METRIC_FIELDS: tuple[str, ...] = (
+    "efficiency",
+    "latency",
+    "restless_periods",
+    "average_breath",
+    "average_heart_rate",
+    "average_hrv",
+    "lowest_heart_rate",
+)
+
+# Readiness record fields dropped besides the "*_timestamp" ones
+READINESS_DROP_FIELDS: frozenset[str] = frozenset({"id", "timestamp"})
+
+# Connection pool shared by every OuraClient, so tool calls reuse keep-alive
+# connections to the Oura API instead of opening a new one each time. HTTP/2
+# lets concurrent requests share a single connection. Created on first use and
+# closed by the server lifespan on shutdown.
+_http_client: Optional[httpx.AsyncClient] = None
+
+# Seconds a successfully validated token is trusted before validating it again
+TOKEN_VALIDATION_TTL = 15 * 60
+
+# Most validated tokens remembered, least recently used dropped first
+MAX_VALIDATED_TOKENS = 128
+
+# Token hash -> time.monotonic() of the last successful validation, in least
+# to most recently used order; expired entries are dropped on lookup
+_validated_tokens: OrderedDict[str, float] = OrderedDict()
+
+# Most OuraClient instances kept for reuse, least recently used dropped first
+MAX_CACHED_CLIENTS = 128
+
+# Token hash -> OuraClient, in least to most recently used order
+_clients: OrderedDict[str, "OuraClient"] = OrderedDict()
+
+# Seconds a transformed Oura response is served from cache. Ranges that end
+# before today no longer change as the day goes on, so they are kept longer.
+RESPONSE_CACHE_TTL = 10 * 60
+PAST_RESPONSE_CACHE_TTL = 60 * 60
+MAX_CACHED_RESPONSES = 1024
+
+# (token hash, endpoint, start date, end date) -> (time.monotonic() expiry, response),
+# in least to most recently used order; expired entries are dropped on lookup
+_response_cache: OrderedDict[
+    tuple[str, str, date, date], tuple[float, dict[str, Any]]
+] = OrderedDict()
+
+_fromisoformat = datetime.fromisoformat
+
+# Date shape accepted from tool arguments ("YYYY-MM-DD"), ASCII digits only;
+# whether the date is real is left to date.fromisoformat
+_DATE_RE = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}")
+
+# Timestamp shape Oura sends ("YYYY-MM-DDTHH:MM:SS", optional milli or
+# microseconds, "Z" or "+HH:MM" offset) with in-range clock fields, ASCII
+# digits only; the date part still needs checking on its own
+_TIMESTAMP_RE = re.compile(
+    r"[0-9]{4}-[0-9]{2}-[0-9]{2}T(?P<hour>[01][0-9]|2[0-3]):(?P<minute>[0-5][0-9])"
+    r":[0-5][0-9](?:\.[0-9]{3}|\.[0-9]{6})?(?:Z|[+-](?:[01][0-9]|2[0-3]):[0-5][0-9])?"
+)
+
+# Shared stand-in for missing nested objects; never mutate it
+_EMPTY: dict[str, Any] = {}
+
+# Plural suffix indexed by "count != 1"
+_PLURAL: tuple[str, str] = ("", "s")
+
+# Duration templates keyed by which of (hours, minutes, seconds) are non-zero
+_DURATION_FORMATS: dict[tuple[bool, bool, bool], str] = {
+    (False, False, False): "0 seconds",
+    (False, False, True): "{s} second{ss}",
+    (False, True, False): "{m} minute{ms}",
+    (False, True, True): "{m} minute{ms}, {s} second{ss}",
+    (True, False, False): "{h} hour{hs}",
+    (True, False, True): "{h} hour{hs}, {s} second{ss}",
+    (True, True, False): "{h} hour{hs}, {m} minute{ms}",
+    (True, True, True): "{h} hour{hs}, {m} minute{ms}, {s} second{ss}",
+}
+
+
+@lru_cache(maxsize=4096)
+def _format_duration(seconds: int) -> str:
+    """
+    Format duration in seconds to a human-readable string.
+
+    Results are cached, since the same durations come up again and again
+    across records and requests.
+
+    Args:
+        seconds: Duration in seconds
+
+    Returns:
+        Formatted string (e.g., "7 hours, 30 minutes, 15 seconds")
+    """
+    hours, remainder = divmod(seconds, 3600)
+    minutes, seconds = divmod(remainder, 60)
+
+    return _DURATION_FORMATS[hours > 0, minutes > 0, seconds > 0].format(
+        h=hours,
+        m=minutes,
+        s=seconds,
+        hs=_PLURAL[hours != 1],
+        ms=_PLURAL[minutes != 1],
+        ss=_PLURAL[seconds != 1],
+    )
+
+
+@lru_cache(maxsize=4096)
+def _format_time(timestamp: str) -> str:
+    """
+    Format ISO timestamp to a time-only string.
+
+    Args:
+        timestamp: ISO timestamp string
+
+    Returns:
+        Formatted time string (e.g., "10:30 PM")
+    """
+    if not timestamp:
+        return ""
+
+    # For the usual Oura timestamp read the hour and minute straight from the
+    # string once the date is known to be real, and only fall back to full
+    # parsing for anything else
+    match = _TIMESTAMP_RE.fullmatch(timestamp)
+    if match is not None:
+        try:
+            date.fromisoformat(timestamp[:10])
+        except ValueError:
+            return timestamp
+        hour = int(match["hour"])
+        suffix = "AM" if hour < 12 else "PM"
+        return f"{hour % 12 or 12:02d}:{match['minute']} {suffix}"
+
+    try:
+        dt = _fromisoformat(timestamp.replace("Z", "+00:00"))
+        return dt.strftime("%I:%M %p")
+    except (ValueError, TypeError):
+        return timestamp
+
+
+def _transform_sleep_item(item: dict[str, Any]) -> dict[str, Any]:
+    """
+    Transform a raw Oura sleep record into the shape returned by the server.
+
+    Args:
+        item: Sleep record from the Oura API
+
+    Returns:
+        Record with formatted times and durations
+    """
+    get = item.get
+
+    # Copy the day and format bedtime timestamps
+    transformed_item: dict[str, Any] = {
+        "day": get("day"),
+        "bedtime_start": _format_time(get("bedtime_start", "")),
+        "bedtime_end": _format_time(get("bedtime_end", "")),
+    }
+
+    # Format time durations and copy the remaining metrics as-is
+    for field in SLEEP_DURATION_FIELDS:
+        transformed_item[field] = _format_duration(get(field, 0))
+    for field in SLEEP_METRIC_FIELDS:
+        transformed_item[field] = get(field)
+
+    # Add readiness data if available
+    readiness = get("readiness") or _EMPTY
+    readiness_score = readiness.get("score")
+    if readiness_score is not None:
+        transformed_item["readiness_score"] = readiness_score
+        transformed_item["readiness_contributors"] = readiness.get(
+            "contributors", {}
+        )
+
+    return transformed_item
+
+
+def _readiness_drop_fields(keys: Iterable[str]) -> list[str]:
+    """
+    Pick the id and timestamp fields to drop from a readiness record.
+
+    Args:
+        keys: Field names of the record
+
+    Returns:
+        Field names to remove
+    """
+    return [k for k in keys if k in READINESS_DROP_FIELDS or k.endswith("_timestamp")]
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Get the shared connection pool, creating it if needed.
+
+    Returns:
+        Shared HTTP client
+    """
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            http2=True,
+            timeout=30.0,
+            limits=httpx.Limits(max_keepalive_connections=32, keepalive_expiry=60),
+        )
+    return _http_client
+
+
+@asynccontextmanager
+async def lifespan(server: FastMCP) -> AsyncIterator[dict[str, Any]]:
+    """
+    Close the shared connection pool when the MCP server shuts down.
+
+    Args:
+        server: The server instance this lifespan is managing
+
+    Yields:
+        Empty lifespan context
+    """
+    try:
+        yield {}
+    finally:
+        if _http_client is not None:
+            await _http_client.aclose()
 
 
 class OuraClient:
@@ -20,18 +270,33 @@ class OuraClient:
 
     BASE_URL = "https://api.ouraring.com/v2/usercollection"
 
-    def __init__(self, access_token: str):
+    def __init__(
+        self, access_token: str, http_client: Optional[httpx.AsyncClient] = None
+    ):
         """
         Initialize the Oura API client.
 
         Args:
             access_token: Personal access token for Oura API
+            http_client: HTTP client to send requests with (optional, defaults
+                to the shared connection pool)
         """
         self.access_token = access_token
-        self.headers = {"Authorization": f"Bearer {access_token}"}
-        self.client = httpx.Client(timeout=30.0)
+        self.token_key = _token_key(access_token)
+        self.headers = {
+            "Authorization": f"Bearer {access_token}",
+            "Accept-Encoding": "br, gzip",
+        }
+        self._http_client = http_client
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """HTTP client requests are sent with."""
+        if self._http_client is not None:
+            return self._http_client
+        return get_http_client()
 
-    def get_sleep_data(
+    async def get_sleep_data(
         self, start_date: date, end_date: Optional[date] = None
     ) -> dict[str, Any]:
         """
@@ -47,128 +312,106 @@ class OuraClient:
         if end_date is None:
             end_date = start_date
 
-        params = {
-            "start_date": start_date.isoformat(),
-            "end_date": end_date.isoformat(),
-        }
-
-        url = f"{self.BASE_URL}/sleep"
-        response = self.client.get(url, headers=self.headers, params=params)
-
-        if response.status_code != 200:
-            error_msg = f"Error {response.status_code}: {response.text}"
-            raise Exception(error_msg)
+        cached = self._get_cached_response("sleep", start_date, end_date)
+        if cached is not None:
+            return cached
 
         # Get the raw response
-        raw_data = response.json()
+        raw_data = await self._get_json(
+            "sleep", start_date.isoformat(), end_date.isoformat()
+        )
 
         # Transform the data
-        transformed_data = []
-
-        for item in raw_data.get("data", []):
-            # Format time durations
-            awake_time = self._format_duration(item.get("awake_time", 0))
-            deep_sleep_duration = self._format_duration(
-                item.get("deep_sleep_duration", 0)
-            )
-            light_sleep_duration = self._format_duration(
-                item.get("light_sleep_duration", 0)
-            )
-            rem_sleep_duration = self._format_duration(
-                item.get("rem_sleep_duration", 0)
-            )
-            total_sleep_duration = self._format_duration(
-                item.get("total_sleep_duration", 0)
-            )
-            time_in_bed = self._format_duration(item.get("time_in_bed", 0))
-
-            # Format bedtime timestamps
-            bedtime_start = self._format_time(item.get("bedtime_start", ""))
-            bedtime_end = self._format_time(item.get("bedtime_end", ""))
-
-            # Extract readiness data if available
-            readiness = item.get("readiness", {})
-            readiness_score = readiness.get("score") if readiness else None
-            readiness_contributors = (
-                readiness.get("contributors", {}) if readiness else {}
-            )
-
-            # Create transformed item
-            transformed_item = {
-                "day": item.get("day"),
-                "bedtime_start": bedtime_start,
-                "bedtime_end": bedtime_end,
-                "awake_time": awake_time,
-                "deep_sleep_duration": deep_sleep_duration,
-                "light_sleep_duration": light_sleep_duration,
-                "rem_sleep_duration": rem_sleep_duration,
-                "total_sleep_duration": total_sleep_duration,
-                "time_in_bed": time_in_bed,
-                "efficiency": item.get("efficiency"),
-                "latency": item.get("latency"),
-                "restless_periods": item.get("restless_periods"),
-                "average_breath": item.get("average_breath"),
-                "average_heart_rate": item.get("average_heart_rate"),
-                "average_hrv": item.get("average_hrv"),
-                "lowest_heart_rate": item.get("lowest_heart_rate"),
-            }
-
-            # Add readiness data if available
-            if readiness_score is not None:
-                transformed_item["readiness_score"] = readiness_score
-                transformed_item["readiness_contributors"] = readiness_contributors
-
-            transformed_data.append(transformed_item)
+        transformed_data = [
+            _transform_sleep_item(item) for item in raw_data.get("data", [])
+        ]
 
         # Return with the original structure but with transformed data
-        return {"data": transformed_data}
+        result = {"data": transformed_data}
+        self._store_cached_response("sleep", start_date, end_date, result)
+        return result
 
-    def _format_duration(self, seconds: int) -> str:
+    async def _get_json(self, endpoint: str, start_iso: str, end_iso: str) -> Any:
         """
-        Format duration in seconds to a human-readable string.
+        Fetch and decode one Oura collection for a date range.
 
         Args:
-            seconds: Duration in seconds
+            endpoint: Oura collection name (e.g., "sleep")
+            start_iso: Start date in ISO format (YYYY-MM-DD)
+            end_iso: End date in ISO format (YYYY-MM-DD)
 
         Returns:
-            Formatted string (e.g., "7 hours, 30 minutes, 15 seconds")
+            Decoded JSON response
         """
-        hours, remainder = divmod(seconds, 3600)
-        minutes, seconds = divmod(remainder, 60)
+        params = {"start_date": start_iso, "end_date": end_iso}
 
-        parts = []
-        if hours > 0:
-            parts.append(f"{hours} hour{'s' if hours != 1 else ''}")
-        if minutes > 0:
-            parts.append(f"{minutes} minute{'s' if minutes != 1 else ''}")
-        if seconds > 0:
-            parts.append(f"{seconds} second{'s' if seconds != 1 else ''}")
+        url = f"{self.BASE_URL}/{endpoint}"
+        response = await self.client.get(url, headers=self.headers, params=params)
 
-        if not parts:
-            return "0 seconds"
+        self._check_response(response)
 
-        return ", ".join(parts)
+        return orjson.loads(response.content)
 
-    def _format_time(self, timestamp: str) -> str:
+    def _get_cached_response(
+        self, endpoint: str, start_date: date, end_date: date
+    ) -> Optional[dict[str, Any]]:
         """
-        Format ISO timestamp to a time-only string.
+        Look up a recent transformed response for this token.
 
         Args:
-            timestamp: ISO timestamp string
+            endpoint: Oura collection name (e.g., "sleep")
+            start_date: Start date of the query
+            end_date: End date of the query
 
         Returns:
-            Formatted time string (e.g., "10:30 PM")
+            Cached response, or None if there is no fresh entry
+        """
+        key = (self.token_key, endpoint, start_date, end_date)
+        entry = _response_cache.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() > entry[0]:
+            del _response_cache[key]
+            return None
+        _response_cache.move_to_end(key)
+        return entry[1]
+
+    def _store_cached_response(
+        self, endpoint: str, start_date: date, end_date: date, result: dict[str, Any]
+    ) -> None:
         """
-        if not timestamp:
-            return ""
+        Cache a transformed response for this token.
 
-        try:
-            dt = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
-            return dt.strftime("%I:%M %p")
-        except (ValueError, TypeError):
-            return timestamp
+        Args:
+            endpoint: Oura collection name (e.g., "sleep")
+            start_date: Start date of the query
+            end_date: End date of the query
+            result: Transformed response to cache
+        """
+        key = (self.token_key, endpoint, start_date, end_date)
+        ttl = PAST_RESPONSE_CACHE_TTL if end_date < date.today() else RESPONSE_CACHE_TTL
+        _response_cache[key] = (time.monotonic() + ttl, result)
+        _response_cache.move_to_end(key)
+        if len(_response_cache) > MAX_CACHED_RESPONSES:
+            _response_cache.popitem(last=False)
+
+    def _check_response(self, response: httpx.Response) -> None:
+        """
+        Raise an error if an Oura API response was not successful.
+
+        A 401 also drops the token from the validation cache, so the next
+        tool call validates it again.
+
+        Args:
+            response: Response returned by the Oura API
+        """
+        if response.status_code != 200:
+            if response.status_code == 401:
+                forget_validated_token(self.access_token)
+            error_msg = f"Error {response.status_code}: {response.text}"
+            raise Exception(error_msg)
 
-    def get_daily_sleep_data(
+    async def get_daily_sleep_data(
         self, start_date: date, end_date: Optional[date] = None
     ) -> dict[str, Any]:
         """
@@ -184,40 +427,35 @@ class OuraClient:
         if end_date is None:
             end_date = start_date
 
-        params = {
-            "start_date": start_date.isoformat(),
-            "end_date": end_date.isoformat(),
-        }
-
-        url = f"{self.BASE_URL}/daily_sleep"
-        response = self.client.get(url, headers=self.headers, params=params)
-
-        if response.status_code != 200:
-            error_msg = f"Error {response.status_code}: {response.text}"
-            raise Exception(error_msg)
+        cached = self._get_cached_response("daily_sleep", start_date, end_date)
+        if cached is not None:
+            return cached
 
         # Get the raw response
-        raw_data = response.json()
+        raw_data = await self._get_json(
+            "daily_sleep", start_date.isoformat(), end_date.isoformat()
+        )
 
         # Transform the data - just return the data array directly
-        transformed_data = []
+        # (records are edited in place, nothing else holds the decoded dicts)
+        transformed_data = raw_data.get("data", [])
 
-        for item in raw_data.get("data", []):
-            # Create transformed item without the id field
-            transformed_item = {k: v for k, v in item.items() if k != "id"}
+        for item in transformed_data:
+            # Drop the id field
+            item.pop("id", None)
 
             # Format any duration fields if present
-            if "total_sleep_duration" in transformed_item:
-                transformed_item["total_sleep_duration"] = self._format_duration(
-                    transformed_item["total_sleep_duration"]
+            if "total_sleep_duration" in item:
+                item["total_sleep_duration"] = _format_duration(
+                    item["total_sleep_duration"]
                 )
 
-            transformed_data.append(transformed_item)
-
         # Return with the original structure but with transformed data
-        return {"data": transformed_data}
+        result = {"data": transformed_data}
+        self._store_cached_response("daily_sleep", start_date, end_date, result)
+        return result
 
-    def get_readiness_data(
+    async def get_readiness_data(
         self, start_date: date, end_date: Optional[date] = None
     ) -> dict[str, Any]:
         """
@@ -233,37 +471,38 @@ class OuraClient:
         if end_date is None:
             end_date = start_date
 
-        params = {
-            "start_date": start_date.isoformat(),
-            "end_date": end_date.isoformat(),
-        }
-
-        url = f"{self.BASE_URL}/daily_readiness"
-        response = self.client.get(url, headers=self.headers, params=params)
-
-        if response.status_code != 200:
-            error_msg = f"Error {response.status_code}: {response.text}"
-            raise Exception(error_msg)
+        cached = self._get_cached_response("daily_readiness", start_date, end_date)
+        if cached is not None:
+            return cached
 
         # Get the raw response
-        raw_data = response.json()
+        raw_data = await self._get_json(
+            "daily_readiness", start_date.isoformat(), end_date.isoformat()
+        )
 
         # Transform the data - just return the data array directly
-        transformed_data = []
-
-        for item in raw_data.get("data", []):
-            # Create transformed item without the id field and timestamp fields
-            transformed_item = {
-                k: v
-                for k, v in item.items()
-                if k != "id" and not k.endswith("_timestamp") and k != "timestamp"
-            }
-            transformed_data.append(transformed_item)
+        # (records are edited in place, nothing else holds the decoded dicts)
+        transformed_data = raw_data.get("data", [])
+
+        # Records normally share the same keys, so find the id and timestamp
+        # fields to drop once from the first one and recompute them only for
+        # a record whose keys differ
+        first_keys = set(transformed_data[0]) if transformed_data else set()
+        drop = _readiness_drop_fields(first_keys)
+
+        for item in transformed_data:
+            item_drop = (
+                drop if item.keys() == first_keys else _readiness_drop_fields(item)
+            )
+            for k in item_drop:
+                item.pop(k, None)
 
         # Return with the original structure but with transformed data
-        return {"data": transformed_data}
+        result = {"data": transformed_data}
+        self._store_cached_response("daily_readiness", start_date, end_date, result)
+        return result
 
-    def get_resilience_data(
+    async def get_resilience_data(
         self, start_date: date, end_date: Optional[date] = None
     ) -> dict[str, Any]:
         """
@@ -279,35 +518,31 @@ class OuraClient:
         if end_date is None:
             end_date = start_date
 
-        params = {
-            "start_date": start_date.isoformat(),
-            "end_date": end_date.isoformat(),
-        }
-
-        url = f"{self.BASE_URL}/daily_resilience"
-        response = self.client.get(url, headers=self.headers, params=params)
-
-        if response.status_code != 200:
-            error_msg = f"Error {response.status_code}: {response.text}"
-            raise Exception(error_msg)
+        cached = self._get_cached_response("daily_resilience", start_date, end_date)
+        if cached is not None:
+            return cached
 
         # Get the raw response
-        raw_data = response.json()
+        raw_data = await self._get_json(
+            "daily_resilience", start_date.isoformat(), end_date.isoformat()
+        )
 
         # Transform the data - just return the data array directly
-        transformed_data = []
+        # (records are edited in place, nothing else holds the decoded dicts)
+        transformed_data = raw_data.get("data", [])
 
-        for item in raw_data.get("data", []):
-            # Create transformed item without the id field
-            transformed_item = {k: v for k, v in item.items() if k != "id"}
-            transformed_data.append(transformed_item)
+        for item in transformed_data:
+            # Drop the id field
+            item.pop("id", None)
 
         # Return with the original structure but with transformed data
-        return {"data": transformed_data}
+        result = {"data": transformed_data}
+        self._store_cached_response("daily_resilience", start_date, end_date, result)
+        return result
 
-    def close(self) -> None:
-        """Close the HTTP client."""
-        self.client.close()
+
+# Cached date.fromisoformat; invalid strings raise and are not cached
+_parse_iso_date = lru_cache(maxsize=1024)(date.fromisoformat)
 
 
 def parse_date(date_str: str) -> date:
@@ -320,15 +555,33 @@ def parse_date(date_str: str) -> date:
     Returns:
         Date object
     """
+    error = f"Invalid date format: {date_str}. Expected format: YYYY-MM-DD"
+
+    # Reject anything not shaped like YYYY-MM-DD before trying to parse it
+    if _DATE_RE.fullmatch(date_str) is None:
+        raise ValueError(error)
+
     try:
-        return date.fromisoformat(date_str)
+        return _parse_iso_date(date_str)
     except ValueError as err:
-        raise ValueError(
-            f"Invalid date format: {date_str}. Expected format: YYYY-MM-DD"
-        ) from err
+        raise ValueError(error) from err
+
+
+def parse_date_range(start_date: str, end_date: str) -> tuple[date, date]:
+    """
+    Parse the start and end of a date range in ISO format (YYYY-MM-DD).
+
+    Args:
+        start_date: Start date string in ISO format
+        end_date: End date string in ISO format
+
+    Returns:
+        Tuple of start and end date objects
+    """
+    return parse_date(start_date), parse_date(end_date)
 
 
-def validate_oura_token(access_token: str) -> bool:
+async def validate_oura_token(access_token: str) -> Optional[bool]:
     """
     Validate an Oura API token by making a simple API call.
     
@@ -336,28 +589,108 @@ def validate_oura_token(access_token: str) -> bool:
         access_token: Personal access token for Oura API
         
     Returns:
-        True if token is valid, False otherwise
+        True if token is valid, False if it is rejected or the call fails,
+        None if the API answered without confirming it (e.g., rate limited)
     """
     try:
         client = OuraClient(access_token)
         # Make a simple API call to test the token
-        response = client.client.get(
+        response = await client.client.get(
             f"{client.BASE_URL}/sleep",
             headers=client.headers,
             params={"start_date": "2024-01-01", "end_date": "2024-01-01"}
         )
-        client.close()
         
         if response.status_code == 401:
             return False
-        return True
+        return True if response.status_code == 200 else None
     except Exception:
         return False
 
 
-def create_oura_client(access_token: str) -> OuraClient:
+def _token_key(access_token: str) -> str:
+    """
+    Hash an access token for use as a cache key.
+
+    Args:
+        access_token: Personal access token for Oura API
+
+    Returns:
+        Hex digest of the token
+    """
+    return hashlib.blake2b(access_token.encode(), digest_size=16).hexdigest()
+
+
+def forget_validated_token(access_token: str) -> None:
+    """
+    Remove a token from the validation cache.
+
+    Args:
+        access_token: Personal access token for Oura API
+    """
+    _validated_tokens.pop(_token_key(access_token), None)
+
+
+def _is_recently_validated(key: str) -> bool:
+    """
+    Check whether a token was successfully validated within the TTL.
+
+    Args:
+        key: Hash of the access token
+
+    Returns:
+        True if the token can be trusted without validating it again
+    """
+    validated_at = _validated_tokens.get(key)
+    if validated_at is None:
+        return False
+    if time.monotonic() - validated_at > TOKEN_VALIDATION_TTL:
+        del _validated_tokens[key]
+        return False
+    _validated_tokens.move_to_end(key)
+    return True
+
+
+def _remember_validated_token(key: str) -> None:
+    """
+    Record a successful token validation.
+
+    Args:
+        key: Hash of the access token
+    """
+    _validated_tokens[key] = time.monotonic()
+    _validated_tokens.move_to_end(key)
+    if len(_validated_tokens) > MAX_VALIDATED_TOKENS:
+        _validated_tokens.popitem(last=False)
+
+
+def _get_cached_client(key: str, access_token: str) -> OuraClient:
+    """
+    Get the cached OuraClient for a token, creating it if needed.
+
+    Args:
+        key: Hash of the access token
+        access_token: Personal access token for Oura API
+
+    Returns:
+        OuraClient instance
     """
-    Create an OuraClient instance with the provided access token.
+    client = _clients.get(key)
+    if client is None:
+        client = OuraClient(access_token)
+        _clients[key] = client
+        if len(_clients) > MAX_CACHED_CLIENTS:
+            _clients.popitem(last=False)
+    else:
+        _clients.move_to_end(key)
+    return client
+
+
+async def create_oura_client(access_token: str) -> OuraClient:
+    """
+    Get an OuraClient instance for the provided access token.
+
+    Clients are cached per token, so repeated tool calls reuse the same one.
     
     Args:
         access_token: Personal access token for Oura API
@@ -368,73 +701,93 @@ def create_oura_client(access_token: str) -> OuraClient:
     if not access_token:
         raise ValueError("Access token is required")
     
-    # Validate the token first
-    if not validate_oura_token(access_token):
-        raise ValueError("Invalid Oura API token. Please check your Personal Access Token and try again.")
+    # Validate the token first, unless it was validated recently
+    key = _token_key(access_token)
+    if not _is_recently_validated(key):
+        valid = await validate_oura_token(access_token)
+        if valid is False:
+            raise ValueError("Invalid Oura API token. Please check your Personal Access Token and try again.")
+        # Only trust a confirmed token; an inconclusive check is retried next call
+        if valid:
+            _remember_validated_token(key)
     
-    return OuraClient(access_token)
+    return _get_cached_client(key, access_token)
 
 
-# Create MCP server
-mcp = FastMCP("Oura API MCP Server")
-
-# Add tools for querying sleep data
-@mcp.tool()
-def get_sleep_data(access_token: str, start_date: str, end_date: str) -> dict[str, Any]:
+def serialize_tool_result(data: Any) -> str:
     """
-    Get sleep data for a specific date range.
+    Serialize a tool result to the JSON text sent back to the MCP client.
+
+    Registered as FastMCP's tool_serializer, which only exists in FastMCP 2.x
+    (see requirements.txt). Non-string keys are stringified and values orjson
+    cannot encode fall back to str(), like FastMCP's default serializer.
 
     Args:
-        access_token: Your Oura Personal Access Token
-        start_date: Start date in ISO format (YYYY-MM-DD)
-        end_date: End date in ISO format (YYYY-MM-DD)
+        data: Value returned by a tool
 
     Returns:
-        Dictionary containing sleep data
+        JSON string
     """
-    try:
-        oura_client = create_oura_client(access_token)
-        start = parse_date(start_date)
-        end = parse_date(end_date)
-        result = oura_client.get_sleep_data(start, end)
-        oura_client.close()
-        return result
-    except ValueError as e:
-        return {"error": str(e), "type": "invalid_token"}
-    except Exception as e:
-        return {"error": f"Failed to fetch sleep data: {str(e)}", "type": "api_error"}
+    return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
 
 
-@mcp.tool()
-def get_readiness_data(access_token: str, start_date: str, end_date: str) -> dict[str, Any]:
+def handle_tool_errors(
+    description: str,
+) -> Callable[
+    [Callable[P, Awaitable[dict[str, Any]]]], Callable[P, Awaitable[dict[str, Any]]]
+]:
     """
-    Get readiness data for a specific date range.
+    Return failures from an MCP tool as an error dictionary.
+
+    ValueErrors (missing or invalid token, bad dates) are reported with type
+    "invalid_token" and any other exception with type "api_error".
 
     Args:
-        access_token: Your Oura Personal Access Token
-        start_date: Start date in ISO format (YYYY-MM-DD)
-        end_date: End date in ISO format (YYYY-MM-DD)
+        description: What the tool fetches, used in the error message
+            (e.g., "sleep data")
 
     Returns:
-        Dictionary containing readiness data
+        Decorator to apply beneath @mcp.tool()
     """
-    try:
-        oura_client = create_oura_client(access_token)
-        start = parse_date(start_date)
-        end = parse_date(end_date)
-        result = oura_client.get_readiness_data(start, end)
-        oura_client.close()
-        return result
-    except ValueError as e:
-        return {"error": str(e), "type": "invalid_token"}
-    except Exception as e:
-        return {"error": f"Failed to fetch readiness data: {str(e)}", "type": "api_error"}
 
+    def decorator(
+        fn: Callable[P, Awaitable[dict[str, Any]]],
+    ) -> Callable[P, Awaitable[dict[str, Any]]]:
+        @wraps(fn)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> dict[str, Any]:
+            try:
+                return await fn(*args, **kwargs)
+            except ValueError as e:
+                return {"error": str(e), "type": "invalid_token"}
+            except Exception as e:
+                return {"error": f"Failed to fetch {description}: {str(e)}", "type": "api_error"}
 
-@mcp.tool()
-def get_resilience_data(access_token: str, start_date: str, end_date: str) -> dict[str, Any]:
+        return wrapper
+
+    return decorator
+
+
+def _make_range_tool(kind: str) -> Callable[..., Any]:
     """
-    Get resilience data for a specific date range.
+    Build the MCP tool that fetches one kind of Oura data for a date range.
+
+    Args:
+        kind: Kind of data, matching an OuraClient getter (e.g., "sleep" for
+            get_sleep_data)
+
+    Returns:
+        Tool function named get_<kind>_data
+    """
+    method_name = f"get_{kind}_data"
+
+    async def tool(access_token: str, start_date: str, end_date: str) -> dict[str, Any]:
+        oura_client = await create_oura_client(access_token)
+        start, end = parse_date_range(start_date, end_date)
+        return await getattr(oura_client, method_name)(start, end)
+
+    tool.__name__ = tool.__qualname__ = method_name
+    tool.__doc__ = f"""
+    Get {kind} data for a specific date range.
 
     Args:
         access_token: Your Oura Personal Access Token
@@ -442,89 +795,94 @@ def get_resilience_data(access_token: str, start_date: str, end_date: str) -> di
         end_date: End date in ISO format (YYYY-MM-DD)
 
     Returns:
-        Dictionary containing resilience data
+        Dictionary containing {kind} data
     """
-    try:
-        oura_client = create_oura_client(access_token)
-        start = parse_date(start_date)
-        end = parse_date(end_date)
-        result = oura_client.get_resilience_data(start, end)
-        oura_client.close()
-        return result
-    except ValueError as e:
-        return {"error": str(e), "type": "invalid_token"}
-    except Exception as e:
-        return {"error": f"Failed to fetch resilience data: {str(e)}", "type": "api_error"}
+    return handle_tool_errors(f"{kind} data")(tool)
 
 
-# Add tools for querying today's data
-@mcp.tool()
-def get_today_sleep_data(access_token: str) -> dict[str, Any]:
+def _make_today_tool(kind: str) -> Callable[..., Any]:
     """
-    Get sleep data for today.
+    Build the MCP tool that fetches one kind of Oura data for today.
 
     Args:
-        access_token: Your Oura Personal Access Token
+        kind: Kind of data, matching an OuraClient getter (e.g., "sleep" for
+            get_sleep_data)
 
     Returns:
-        Dictionary containing sleep data for today
+        Tool function named get_today_<kind>_data
     """
-    try:
-        oura_client = create_oura_client(access_token)
+    method_name = f"get_{kind}_data"
+
+    async def tool(access_token: str) -> dict[str, Any]:
+        oura_client = await create_oura_client(access_token)
         today = date.today()
-        result = oura_client.get_sleep_data(today, today)
-        oura_client.close()
-        return result
-    except ValueError as e:
-        return {"error": str(e), "type": "invalid_token"}
-    except Exception as e:
-        return {"error": f"Failed to fetch today's sleep data: {str(e)}", "type": "api_error"}
+        return await getattr(oura_client, method_name)(today, today)
 
-
-@mcp.tool()
-def get_today_readiness_data(access_token: str) -> dict[str, Any]:
-    """
-    Get readiness data for today.
+    tool.__name__ = tool.__qualname__ = f"get_today_{kind}_data"
+    tool.__doc__ = f"""
+    Get {kind} data for today.
 
     Args:
         access_token: Your Oura Personal Access Token
 
     Returns:
-        Dictionary containing readiness data for today
+        Dictionary containing {kind} data for today
     """
-    try:
-        oura_client = create_oura_client(access_token)
-        today = date.today()
-        result = oura_client.get_readiness_data(today, today)
-        oura_client.close()
-        return result
-    except ValueError as e:
-        return {"error": str(e), "type": "invalid_token"}
-    except Exception as e:
-        return {"error": f"Failed to fetch today's readiness data: {str(e)}", "type": "api_error"}
+    return handle_tool_errors(f"today's {kind} data")(tool)
+
+
+# Create MCP server
+mcp = FastMCP(
+    "Oura API MCP Server", lifespan=lifespan, tool_serializer=serialize_tool_result
+)
+
+# Add tools for querying sleep, readiness, and resilience data
+get_sleep_data = mcp.tool()(_make_range_tool("sleep"))
+get_readiness_data = mcp.tool()(_make_range_tool("readiness"))
+get_resilience_data = mcp.tool()(_make_range_tool("resilience"))
+
+# Add tools for querying today's data
+get_today_sleep_data = mcp.tool()(_make_today_tool("sleep"))
+get_today_readiness_data = mcp.tool()(_make_today_tool("readiness"))
+get_today_resilience_data = mcp.tool()(_make_today_tool("resilience"))
 
 
 @mcp.tool()
-def get_today_resilience_data(access_token: str) -> dict[str, Any]:
+@handle_tool_errors("today's summary")
+async def get_today_summary(access_token: str) -> dict[str, Any]:
     """
-    Get resilience data for today.
+    Get sleep, readiness, and resilience data for today in a single call.
+
+    The three Oura requests are sent concurrently. If one of them fails, its
+    entry holds an error and the others are still returned.
 
     Args:
         access_token: Your Oura Personal Access Token
 
     Returns:
-        Dictionary containing resilience data for today
+        Dictionary containing today's sleep, readiness, and resilience data
     """
-    try:
-        oura_client = create_oura_client(access_token)
-        today = date.today()
-        result = oura_client.get_resilience_data(today, today)
-        oura_client.close()
-        return result
-    except ValueError as e:
-        return {"error": str(e), "type": "invalid_token"}
-    except Exception as e:
-        return {"error": f"Failed to fetch today's resilience data: {str(e)}", "type": "api_error"}
+    oura_client = await create_oura_client(access_token)
+    today = date.today()
+    results = await asyncio.gather(
+        oura_client.get_sleep_data(today, today),
+        oura_client.get_readiness_data(today, today),
+        oura_client.get_resilience_data(today, today),
+        return_exceptions=True,
+    )
+
+    summary: dict[str, Any] = {}
+    for name, result in zip(("sleep", "readiness", "resilience"), results):
+        if isinstance(result, Exception):
+            summary[name] = {
+                "error": f"Failed to fetch today's {name} data: {str(result)}",
+                "type": "api_error",
+            }
+        elif isinstance(result, BaseException):
+            raise result
+        else:
+            summary[name] = result
+    return summary
 
 
 def main() -> None:
@@ -57,10 +57,12 @@ async def test_datetime_server():
         }
     }
     
-    async with httpx.AsyncClient() as client:
+    async with httpx.AsyncClient(
+        limits=httpx.Limits(max_keepalive_connections=10)
+    ) as client:
         print("Testing datetime server...")
         
-        # Test initialization
+        # Test initialization (must finish before any other request)
         print("\n1. Testing initialization...")
         try:
             response = await client.post(url, json=init_request, headers=headers)
@@ -69,23 +71,20 @@ async def test_datetime_server():
         except Exception as e:
             print(f"Error: {e}")
         
-        # Test tools list
-        print("\n2. Testing tools list...")
-        try:
-            response = await client.post(url, json=tools_request, headers=headers)
-            print(f"Status: {response.status_code}")
-            print(f"Response: {response.text}")
-        except Exception as e:
-            print(f"Error: {e}")
-        
-        # Test tool call
-        print("\n3. Testing current_datetime tool...")
-        try:
-            response = await client.post(url, json=call_request, headers=headers)
-            print(f"Status: {response.status_code}")
-            print(f"Response: {response.text}")
-        except Exception as e:
-            print(f"Error: {e}")
+        # Test tools list and tool call concurrently
+        responses = await asyncio.gather(
+            client.post(url, json=tools_request, headers=headers),
+            client.post(url, json=call_request, headers=headers),
+            return_exceptions=True,
+        )
+        titles = ["2. Testing tools list...", "3. Testing current_datetime tool..."]
+        for title, response in zip(titles, responses):
+            print(f"\n{title}")
+            if isinstance(response, Exception):
+                print(f"Error: {response}")
+            else:
+                print(f"Status: {response.status_code}")
+                print(f"Response: {response.text}")
 
 if __name__ == "__main__":
     asyncio.run(test_datetime_server()) 
\ No newline at end of file